@@ -10,13 +10,52 @@ Usage:
 """
 
 import argparse
+import glob
+import hashlib
+import io
 import json
+import os
 import re
+import sys
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, TextIO, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import simdjson
+    # A single parser is reused so its internal buffers are allocated once
+    _simdjson_parser = simdjson.Parser()
+except ImportError:
+    _simdjson_parser = None
+
+
+def _parse_review_bytes(raw: bytes):
+    """Parse raw review JSON, lazily via simdjson when it is installed
+
+    The simdjson document only materializes the keys that are read, and
+    supports the same mapping access (``in``, ``[]``, ``get``, ``items``)
+    as the dict produced by the fallback parsers.
+    """
+    if _simdjson_parser is not None:
+        try:
+            return _simdjson_parser.parse(raw)
+        except RuntimeError:
+            # The shared parser still backs a live document (e.g. one held by
+            # a library caller), so this parse gets a parser of its own
+            return simdjson.Parser().parse(raw)
+    return _loads(raw)
 
 
 class Severity(Enum):
@@ -38,7 +77,40 @@ class IssueCategory(Enum):
     ANTI_PATTERN = "anti_pattern"
 
 
-@dataclass
+# Raw payload value -> enum member, avoiding Enum.__call__ per issue
+_SEVERITY_BY_VALUE = {severity.value: severity for severity in Severity}
+_CATEGORY_BY_VALUE = {category.value: category for category in IssueCategory}
+
+# Score deduction per issue of each severity
+_SEVERITY_WEIGHTS = {
+    Severity.CRITICAL: 10.0,
+    Severity.ERROR: 5.0,
+    Severity.WARNING: 1.0,
+    Severity.INFO: 0.1
+}
+
+# Display strings computed once instead of per formatted issue
+_CATEGORY_DISPLAY = {
+    category: category.value.replace('_', ' ').title() for category in IssueCategory
+}
+
+# Report section headings, in output order; info issues are not listed
+_SEVERITY_HEADINGS = {
+    Severity.CRITICAL: "### 🚨 Critical Issues (Must Fix)",
+    Severity.ERROR: "### ❌ Errors (Should Fix)",
+    Severity.WARNING: "### ⚠️ Warnings",
+}
+
+# Characters that would break out of a markdown table cell
+_MD_TABLE_ESCAPE = re.compile(r'([|`\\])')
+
+
+def _escape_table_cell(text: str) -> str:
+    """Backslash-escape characters that would break a markdown table cell"""
+    return _MD_TABLE_ESCAPE.sub(r'\\\1', text)
+
+
+@dataclass(slots=True)
 class CodeIssue:
     """Represents a code review issue"""
     category: IssueCategory
@@ -50,7 +122,7 @@ class CodeIssue:
     rule_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LayerMetrics:
     """Metrics for architectural layers"""
     name: str
@@ -60,7 +132,7 @@ class LayerMetrics:
     test_coverage: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeMetrics:
     """Overall code metrics"""
     total_files: int = 0
@@ -72,7 +144,7 @@ class CodeMetrics:
     layer_metrics: Dict[str, LayerMetrics] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     """Complete review result"""
     timestamp: datetime
@@ -80,6 +152,14 @@ class ReviewResult:
     issues: List[CodeIssue] = field(default_factory=list)
     passed: bool = True
     score: float = 0.0
+    warnings: List[str] = field(default_factory=list)
+    severity_counts: Dict[Severity, int] = field(default_factory=dict, init=False)
+    category_counts: Dict[IssueCategory, int] = field(default_factory=dict, init=False)
+    timestamp_str: str = field(default="", init=False)
+
+    def __post_init__(self):
+        # Formatted once here rather than via strftime on every report write
+        self.timestamp_str = self.timestamp.isoformat(sep=' ', timespec='seconds')
 
 
 class ReviewParser:
@@ -98,17 +178,20 @@ class ReviewParser:
     def _load_config(self, config_path: Optional[Path]) -> Dict:
         """Load configuration from cursor.json"""
         if config_path and config_path.exists():
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return _loads(f.read())
         return {}
 
     def parse_review_data(self, data: Dict) -> ReviewResult:
-        """Parse review data into structured result"""
+        """Parse review data (a dict or simdjson document) into structured result"""
+        warnings = []
         result = ReviewResult(
-            timestamp=datetime.now(),
+            timestamp=datetime.now(timezone.utc),
             metrics=self._extract_metrics(data),
-            issues=self._extract_issues(data)
+            issues=self._extract_issues(data, warnings),
+            warnings=warnings
         )
+        result.severity_counts, result.category_counts = self._tally(result.issues)
         result.score = self._calculate_score(result)
         result.passed = self._determine_pass_status(result)
         return result
@@ -139,60 +222,126 @@ class ReviewParser:
         
         return metrics
 
-    def _extract_issues(self, data: Dict) -> List[CodeIssue]:
-        """Extract code issues from review data"""
+    def _extract_issues(self, data: Dict, warnings: List[str]) -> List[CodeIssue]:
+        """Extract code issues from review data, appending problems to warnings"""
         issues = []
         
-        if 'issues' in data:
-            for issue_data in data['issues']:
-                try:
-                    issue = CodeIssue(
-                        category=IssueCategory(issue_data.get('category', 'code_quality')),
-                        severity=Severity(issue_data.get('severity', 'info')),
-                        message=issue_data['message'],
-                        file_path=issue_data['file'],
-                        line_number=issue_data.get('line'),
-                        suggestion=issue_data.get('suggestion'),
-                        rule_id=issue_data.get('rule_id')
-                    )
-                    issues.append(issue)
-                except (KeyError, ValueError) as e:
-                    print(f"Warning: Skipping malformed issue: {e}")
+        if 'issues' not in data:
+            return issues
+        
+        # Bind lookups used for every issue to locals once per batch
+        append = issues.append
+        category_for = _CATEGORY_BY_VALUE.get
+        severity_for = _SEVERITY_BY_VALUE.get
+        default_category = IssueCategory.CODE_QUALITY
+        default_severity = Severity.INFO
+        
+        # Malformed issues and unknown enum values are reported once after the
+        # loop, not per issue
+        skipped = 0
+        samples = []
+        defaulted = 0
+        unknown_values = []
+        
+        for issue_data in data['issues']:
+            get = issue_data.get
+            try:
+                category = get('category', 'code_quality')
+                severity = get('severity', 'info')
+                # Lists/objects are malformed rather than unknown values; checked
+                # explicitly so dict and simdjson payloads are skipped alike
+                if not isinstance(category, str):
+                    raise ValueError("category must be a string")
+                if not isinstance(severity, str):
+                    raise ValueError("severity must be a string")
+                message = issue_data['message']
+                file_path = issue_data['file']
+                category_member = category_for(category)
+                severity_member = severity_for(severity)
+                if category_member is None or severity_member is None:
+                    # Keep the issue but make the data problem visible
+                    defaulted += 1
+                    if category_member is None:
+                        category_member = default_category
+                        unknown = f"category {category!r}"
+                        if len(unknown_values) < 3 and unknown not in unknown_values:
+                            unknown_values.append(unknown)
+                    if severity_member is None:
+                        severity_member = default_severity
+                        unknown = f"severity {severity!r}"
+                        if len(unknown_values) < 3 and unknown not in unknown_values:
+                            unknown_values.append(unknown)
+                append(CodeIssue(
+                    category=category_member,
+                    severity=severity_member,
+                    message=message,
+                    file_path=file_path,
+                    line_number=get('line'),
+                    suggestion=get('suggestion'),
+                    rule_id=get('rule_id')
+                ))
+            except (KeyError, ValueError) as e:
+                skipped += 1
+                sample = str(e)
+                if isinstance(e, KeyError):
+                    # simdjson's KeyError carries an error code, not the key name
+                    sample = repr('message' if 'message' not in issue_data else 'file')
+                if len(samples) < 3 and sample not in samples:
+                    samples.append(sample)
+        
+        if skipped:
+            warnings.append(
+                f"Warning: Skipped {skipped} malformed issue(s) "
+                f"(e.g. {', '.join(samples)})"
+            )
+        if defaulted:
+            warnings.append(
+                f"Warning: {defaulted} issue(s) had unknown severity/category, "
+                f"defaulted to info/code_quality (e.g. {', '.join(unknown_values)})"
+            )
         
         return issues
 
+    def _tally(
+        self, issues: List[CodeIssue]
+    ) -> Tuple[Dict[Severity, int], Dict[IssueCategory, int]]:
+        """Count issues per severity and per category in a single pass"""
+        severity_counts = {severity: 0 for severity in Severity}
+        category_counts = {category: 0 for category in IssueCategory}
+        
+        for issue in issues:
+            severity_counts[issue.severity] += 1
+            category_counts[issue.category] += 1
+        
+        return severity_counts, category_counts
+
     def _calculate_score(self, result: ReviewResult) -> float:
         """Calculate overall review score (0-100)"""
         base_score = 100.0
         
         # Deduct points for issues based on severity
-        severity_weights = {
-            Severity.CRITICAL: 10.0,
-            Severity.ERROR: 5.0,
-            Severity.WARNING: 1.0,
-            Severity.INFO: 0.1
-        }
-        
-        for issue in result.issues:
-            base_score -= severity_weights.get(issue.severity, 0)
+        counts = result.severity_counts
+        base_score -= (
+            _SEVERITY_WEIGHTS[Severity.CRITICAL] * counts[Severity.CRITICAL]
+            + _SEVERITY_WEIGHTS[Severity.ERROR] * counts[Severity.ERROR]
+            + _SEVERITY_WEIGHTS[Severity.WARNING] * counts[Severity.WARNING]
+            + _SEVERITY_WEIGHTS[Severity.INFO] * counts[Severity.INFO]
+        )
         
         # Adjust for metrics
-        if result.metrics.test_coverage < 80:
-            base_score -= (80 - result.metrics.test_coverage) * 0.2
+        metrics = result.metrics
+        if metrics.test_coverage < 80:
+            base_score -= (80 - metrics.test_coverage) * 0.2
         
-        if result.metrics.duplication_percentage > 5:
-            base_score -= (result.metrics.duplication_percentage - 5) * 2
+        if metrics.duplication_percentage > 5:
+            base_score -= (metrics.duplication_percentage - 5) * 2
         
         return max(0.0, min(100.0, base_score))
 
     def _determine_pass_status(self, result: ReviewResult) -> bool:
         """Determine if the review passes based on severity thresholds"""
-        severity_counts = {severity: 0 for severity in Severity}
-        
-        for issue in result.issues:
-            severity_counts[issue.severity] += 1
-        
         # Check thresholds
+        severity_counts = result.severity_counts
         for severity, threshold in self.severity_thresholds.items():
             if severity_counts[severity] > threshold:
                 return False
@@ -201,185 +350,368 @@ class ReviewParser:
 
     def generate_markdown_report(self, result: ReviewResult) -> str:
         """Generate markdown report from review result"""
-        timestamp_str = result.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        
-        report_lines = [
-            "# Code Review Summary",
-            "",
-            f"**Generated:** {timestamp_str}",
-            "**Reviewer:** AI Code Review System",
-            "**Version:** 1.0.0",
-            "",
-            "---",
-            "",
-            "## Executive Summary",
-            "",
-            f"### Overall Score: {result.score:.1f}/100.0",
-            "",
-            f"**Status:** {'✅ PASSED' if result.passed else '❌ FAILED'}",
-            "",
-        ]
+        out = io.StringIO()
+        self.write_markdown_report(result, out)
+        return out.getvalue()
+
+    def write_markdown_report(self, result: ReviewResult, out: TextIO) -> None:
+        """Write markdown report for review result to a text stream"""
+        out.write(
+            "# Code Review Summary\n"
+            "\n"
+            f"**Generated:** {result.timestamp_str}\n"
+            "**Reviewer:** AI Code Review System\n"
+            "**Version:** 1.0.0\n"
+            "\n"
+            "---\n"
+            "\n"
+            "## Executive Summary\n"
+            "\n"
+            f"### Overall Score: {result.score:.1f}/100.0\n"
+            "\n"
+            f"**Status:** {'✅ PASSED' if result.passed else '❌ FAILED'}\n"
+            "\n"
+        )
         
         # Add metrics section
-        report_lines.extend(self._generate_metrics_section(result.metrics))
+        self._generate_metrics_section(result.metrics, out)
         
         # Add issues section
-        report_lines.extend(self._generate_issues_section(result.issues))
+        self._generate_issues_section(result.issues, result.severity_counts, out)
         
         # Add recommendations
-        report_lines.extend(self._generate_recommendations(result))
-        
-        return "\n".join(report_lines)
-
-    def _generate_metrics_section(self, metrics: CodeMetrics) -> List[str]:
-        """Generate metrics section of report"""
-        lines = [
-            "## 📊 Metrics",
-            "",
-            "### Code Quality Metrics",
-            "| Metric | Value | Threshold | Status |",
-            "|--------|-------|-----------|--------|",
-            f"| Lines of Code | {metrics.total_lines:,} | - | ✅ |",
-            f"| Avg Complexity | {metrics.avg_complexity:.1f} | 10 | {'✅' if metrics.avg_complexity <= 10 else '❌'} |",
-            f"| Test Coverage | {metrics.test_coverage:.1f}% | 80% | {'✅' if metrics.test_coverage >= 80 else '⚠️'} |",
-            f"| Code Duplication | {metrics.duplication_percentage:.1f}% | < 5% | {'✅' if metrics.duplication_percentage < 5 else '⚠️'} |",
-            f"| Technical Debt | {metrics.technical_debt_ratio:.1f}% | < 5% | {'✅' if metrics.technical_debt_ratio < 5 else '⚠️'} |",
-            "",
-        ]
+        self._generate_recommendations(result, out)
+
+    def _generate_metrics_section(self, metrics: CodeMetrics, out: TextIO) -> None:
+        """Write metrics section of report"""
+        out.write(
+            "## 📊 Metrics\n"
+            "\n"
+            "### Code Quality Metrics\n"
+            "| Metric | Value | Threshold | Status |\n"
+            "|--------|-------|-----------|--------|\n"
+            f"| Lines of Code | {metrics.total_lines:,} | - | ✅ |\n"
+            f"| Avg Complexity | {metrics.avg_complexity:.1f} | 10 | {'✅' if metrics.avg_complexity <= 10 else '❌'} |\n"
+            f"| Test Coverage | {metrics.test_coverage:.1f}% | 80% | {'✅' if metrics.test_coverage >= 80 else '⚠️'} |\n"
+            f"| Code Duplication | {metrics.duplication_percentage:.1f}% | < 5% | {'✅' if metrics.duplication_percentage < 5 else '⚠️'} |\n"
+            f"| Technical Debt | {metrics.technical_debt_ratio:.1f}% | < 5% | {'✅' if metrics.technical_debt_ratio < 5 else '⚠️'} |\n"
+            "\n"
+        )
         
         # Add layer metrics if available
         if metrics.layer_metrics:
-            lines.extend([
-                "### Architecture Metrics",
-                "| Layer | Files | Lines | Violations | Coverage |",
-                "|-------|-------|-------|------------|----------|"
-            ])
-            for layer in metrics.layer_metrics.values():
-                lines.append(
-                    f"| {layer.name} | {layer.file_count} | {layer.line_count:,} | "
-                    f"{layer.violation_count} | {layer.test_coverage:.1f}% |"
-                )
-            lines.append("")
-        
-        return lines
-
-    def _generate_issues_section(self, issues: List[CodeIssue]) -> List[str]:
-        """Generate issues section of report"""
-        lines = [
-            "## 🔍 Code Quality Issues",
-            ""
-        ]
-        
-        # Group issues by severity
-        issues_by_severity = {severity: [] for severity in Severity}
+            out.write(
+                "### Architecture Metrics\n"
+                "| Layer | Files | Lines | Violations | Coverage |\n"
+                "|-------|-------|-------|------------|----------|\n"
+            )
+            layers = metrics.layer_metrics.values()
+            out.write("".join(
+                f"| {_escape_table_cell(layer.name)} | {layer.file_count} | "
+                f"{layer.line_count:,} | {layer.violation_count} | "
+                f"{layer.test_coverage:.1f}% |\n"
+                for layer in layers
+            ))
+            out.write("\n")
+
+    def _generate_issues_section(
+        self,
+        issues: List[CodeIssue],
+        severity_counts: Dict[Severity, int],
+        out: TextIO
+    ) -> None:
+        """Write issues section of report"""
+        if not issues:
+            out.write("## 🔍 Code Quality Issues\n\nNo issues found.\n\n")
+            return
+        
+        out.write("## 🔍 Code Quality Issues\n\n")
+        
+        # Group issues by severity; empty severities never get a bucket
+        issues_by_severity = defaultdict(list)
         for issue in issues:
             issues_by_severity[issue.severity].append(issue)
         
-        # Critical issues
-        if issues_by_severity[Severity.CRITICAL]:
-            lines.extend([
-                "### 🚨 Critical Issues (Must Fix)",
-                ""
-            ])
-            for issue in issues_by_severity[Severity.CRITICAL]:
-                lines.extend(self._format_issue(issue))
-            lines.append("")
-        
-        # Errors
-        if issues_by_severity[Severity.ERROR]:
-            lines.extend([
-                "### ❌ Errors (Should Fix)",
-                ""
-            ])
-            for issue in issues_by_severity[Severity.ERROR]:
-                lines.extend(self._format_issue(issue))
-            lines.append("")
-        
-        # Warnings
-        if issues_by_severity[Severity.WARNING]:
-            lines.extend([
-                "### ⚠️ Warnings",
-                ""
-            ])
-            for issue in issues_by_severity[Severity.WARNING]:
-                lines.extend(self._format_issue(issue))
-            lines.append("")
-        
-        return lines
-
-    def _format_issue(self, issue: CodeIssue) -> List[str]:
-        """Format a single issue for the report"""
-        lines = [
-            f"#### {issue.category.value.replace('_', ' ').title()}",
-            f"- **File:** `{issue.file_path}`"
-        ]
+        for severity, heading in _SEVERITY_HEADINGS.items():
+            if not severity_counts[severity]:
+                continue
+            out.write(f"{heading}\n\n")
+            for issue in issues_by_severity[severity]:
+                self._format_issue(issue, out)
+            out.write("\n")
+
+    def _format_issue(self, issue: CodeIssue, out: TextIO) -> None:
+        """Write a single issue to the report"""
+        out.write(
+            f"#### {_CATEGORY_DISPLAY[issue.category]}\n"
+            f"- **File:** `{issue.file_path}`\n"
+        )
         
         if issue.line_number:
-            lines.append(f"- **Line:** {issue.line_number}")
+            out.write(f"- **Line:** {issue.line_number}\n")
         
         if issue.rule_id:
-            lines.append(f"- **Rule:** {issue.rule_id}")
+            out.write(f"- **Rule:** {issue.rule_id}\n")
         
-        lines.append(f"- **Issue:** {issue.message}")
+        out.write(f"- **Issue:** {issue.message}\n")
         
         if issue.suggestion:
-            lines.append(f"- **Suggestion:** {issue.suggestion}")
+            out.write(f"- **Suggestion:** {issue.suggestion}\n")
         
-        lines.append("")
-        return lines
+        out.write("\n")
 
-    def _generate_recommendations(self, result: ReviewResult) -> List[str]:
-        """Generate recommendations based on review results"""
-        lines = [
-            "## 💡 Recommendations",
-            ""
-        ]
-        
+    def _generate_recommendations(self, result: ReviewResult, out: TextIO) -> None:
+        """Write recommendations based on review results"""
         high_priority = []
         medium_priority = []
         low_priority = []
         
         # Analyze issues and metrics to generate recommendations
-        if result.metrics.test_coverage < 80:
+        metrics = result.metrics
+        if metrics.test_coverage < 80:
             high_priority.append(
-                f"Increase test coverage from {result.metrics.test_coverage:.1f}% to at least 80%"
+                f"Increase test coverage from {metrics.test_coverage:.1f}% to at least 80%"
             )
         
-        critical_count = sum(1 for i in result.issues if i.severity == Severity.CRITICAL)
+        critical_count = result.severity_counts[Severity.CRITICAL]
         if critical_count > 0:
             high_priority.append(f"Fix {critical_count} critical security/architecture issues")
         
-        if result.metrics.duplication_percentage > 5:
+        if metrics.duplication_percentage > 5:
             medium_priority.append(
-                f"Reduce code duplication from {result.metrics.duplication_percentage:.1f}% to below 5%"
+                f"Reduce code duplication from {metrics.duplication_percentage:.1f}% to below 5%"
             )
         
-        arch_violations = sum(
-            1 for i in result.issues if i.category == IssueCategory.ARCHITECTURE
-        )
+        arch_violations = result.category_counts[IssueCategory.ARCHITECTURE]
         if arch_violations > 0:
             high_priority.append(f"Address {arch_violations} clean architecture violations")
         
+        # Omit the section entirely when nothing needs attention
+        if not (high_priority or medium_priority or low_priority):
+            return
+        
         # Format recommendations
+        out.write("## 💡 Recommendations\n\n")
+        
         if high_priority:
-            lines.extend(["### High Priority", ""])
+            out.write("### High Priority\n\n")
             for i, rec in enumerate(high_priority, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
+                out.write(f"{i}. {rec}\n")
+            out.write("\n")
         
         if medium_priority:
-            lines.extend(["### Medium Priority", ""])
+            out.write("### Medium Priority\n\n")
             for i, rec in enumerate(medium_priority, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
+                out.write(f"{i}. {rec}\n")
+            out.write("\n")
         
         if low_priority:
-            lines.extend(["### Low Priority", ""])
+            out.write("### Low Priority\n\n")
             for i, rec in enumerate(low_priority, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
-        
-        return lines
+                out.write(f"{i}. {rec}\n")
+            out.write("\n")
+
+
+# The report's timestamp line, restamped when a cached report is reused
+_GENERATED_LINE = re.compile(rb'^\*\*Generated:\*\* .*$', re.MULTILINE)
+
+
+def _cache_key(raw: bytes, config_path: Optional[Path]) -> str:
+    """Hash the review input together with everything else that shapes its report"""
+    digest = hashlib.sha256()
+    # This script's own source stands in for a format version, so reports
+    # rendered by any other revision of it never match
+    parts = (
+        Path(__file__).read_bytes(),
+        config_path.read_bytes() if config_path else b"",
+        raw,
+    )
+    for part in parts:
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()[:16]
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data via a temp file and rename, so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_cached_report(
+    cache_dir: Path, cache_key: str
+) -> Optional[Tuple[bytes, bool, float, List[str]]]:
+    """Return a cached (report, passed, score, warnings), restamped with the current time"""
+    try:
+        meta = _loads((cache_dir / f"{cache_key}.json").read_bytes())
+        report = (cache_dir / f"{cache_key}.md").read_bytes()
+        passed, score, warnings = meta['passed'], meta['score'], meta['warnings']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    now = datetime.now(timezone.utc).isoformat(sep=' ', timespec='seconds')
+    generated = f"**Generated:** {now}".encode()
+    report = _GENERATED_LINE.sub(lambda _: generated, report, count=1)
+    return report, passed, score, warnings
+
+
+def _store_cached_report(
+    cache_dir: Path, cache_key: str, report_path: Path, result: ReviewResult
+) -> Optional[str]:
+    """Save a rendered report and its outcome under cache_key
+
+    Returns a warning line if the entry could not be written.
+    """
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_atomic(cache_dir / f"{cache_key}.md", report_path.read_bytes())
+        # Metadata is written last so a partial entry is never treated as a hit
+        meta = {"passed": result.passed, "score": result.score, "warnings": result.warnings}
+        _write_atomic(cache_dir / f"{cache_key}.json", json.dumps(meta).encode())
+    except OSError as e:
+        return f"Warning: Could not cache report: {e}"
+    return None
+
+
+def _review_file(
+    input_path: Path,
+    output_path: Path,
+    config_path: Optional[Path],
+    cache_dir: Optional[Path] = None
+) -> Tuple[int, List[str], List[str]]:
+    """Review one input file and write its report
+
+    Returns the exit code, the status lines for stdout and the warning lines
+    for stderr. Nothing is printed here, so batch mode can print each file's
+    lines together.
+    """
+    # Load review data
+    try:
+        with open(input_path, 'rb') as f:
+            raw = f.read()
+        cache_key = _cache_key(raw, config_path) if cache_dir else None
+    except Exception as e:
+        return 1, [f"Error loading review data: {e}"], []
+    
+    # Reuse the report from an identical earlier run if available
+    cached = _load_cached_report(cache_dir, cache_key) if cache_key else None
+    if cached is not None:
+        report, passed, score, warnings = cached
+        try:
+            with open(output_path, 'wb') as f:
+                f.write(report)
+            messages = [f"Review report generated: {output_path} (cached)"]
+        except Exception as e:
+            return 1, [f"Error writing report: {e}"], warnings
+    else:
+        try:
+            review_data = _parse_review_bytes(raw)
+        except Exception as e:
+            return 1, [f"Error loading review data: {e}"], []
+        
+        # Parse and analyze; a payload of the wrong shape fails this file only
+        try:
+            review_parser = ReviewParser(config_path)
+            result = review_parser.parse_review_data(review_data)
+        except Exception as e:
+            return 1, [f"Error analyzing review data in {input_path}: {e}"], []
+        passed, score, warnings = result.passed, result.score, list(result.warnings)
+        
+        # Stream report straight to the output file
+        try:
+            with open(output_path, 'w') as f:
+                review_parser.write_markdown_report(result, f)
+            messages = [f"Review report generated: {output_path}"]
+        except Exception as e:
+            return 1, [f"Error writing report: {e}"], warnings
+        
+        if cache_key:
+            cache_warning = _store_cached_report(cache_dir, cache_key, output_path, result)
+            if cache_warning:
+                warnings.append(cache_warning)
+    
+    # Exit with appropriate code
+    if not passed:
+        messages.append(f"❌ Review FAILED (Score: {score:.1f}/100)")
+        return 1, messages, warnings
+    else:
+        messages.append(f"✅ Review PASSED (Score: {score:.1f}/100)")
+        return 0, messages, warnings
+
+
+def _print_outcome(messages: List[str], warnings: List[str]) -> None:
+    """Print one file's warnings to stderr and its status lines to stdout"""
+    for warning in warnings:
+        print(warning, file=sys.stderr)
+    for message in messages:
+        print(message)
+
+
+def _review_batch(
+    input_paths: List[Path],
+    output_paths: List[Path],
+    config_path: Optional[Path],
+    cache_dir: Optional[Path] = None
+) -> int:
+    """Review several input files in parallel, one worker process per core"""
+    workers = min(os.cpu_count() or 1, len(input_paths))
+    review = partial(_review_file, config_path=config_path, cache_dir=cache_dir)
+    
+    exit_code = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outcomes = executor.map(
+            review,
+            input_paths,
+            output_paths,
+            chunksize=max(1, len(input_paths) // workers)
+        )
+        for code, messages, warnings in outcomes:
+            _print_outcome(messages, warnings)
+            exit_code = max(exit_code, code)
+    
+    return exit_code
+
+
+def _batch_paths(pattern: str) -> Tuple[List[Path], List[Path], List[str]]:
+    """Expand an --input-glob into input paths, their <name>.md report paths
+    and warning lines
+
+    ``**`` matches any number of directories. Markdown files matched by the
+    glob are skipped with a warning, since they are most likely reports from
+    an earlier run. Raises ValueError if no inputs remain or if two inputs
+    would write the same report.
+    """
+    input_paths = []
+    warnings = []
+    for match in sorted(glob.glob(pattern, recursive=True)):
+        path = Path(match)
+        if path.suffix == '.md':
+            warnings.append(f"Warning: Skipping {path}, which looks like a report")
+        elif path.is_file():
+            input_paths.append(path)
+    if not input_paths:
+        raise ValueError(f"No input files match {pattern}")
+    
+    output_paths = [path.with_suffix('.md') for path in input_paths]
+    inputs_by_output = defaultdict(list)
+    for input_path, output_path in zip(input_paths, output_paths):
+        inputs_by_output[output_path].append(str(input_path))
+    collisions = [
+        f"{', '.join(inputs)} -> {output}"
+        for output, inputs in inputs_by_output.items() if len(inputs) > 1
+    ]
+    if collisions:
+        raise ValueError(f"Inputs would overwrite each other's reports: {'; '.join(collisions)}")
+    
+    return input_paths, output_paths, warnings
 
 
 def main():
@@ -387,17 +719,23 @@ def main():
     parser = argparse.ArgumentParser(
         description="Parse and analyze code review results"
     )
-    parser.add_argument(
+    inputs = parser.add_mutually_exclusive_group(required=True)
+    inputs.add_argument(
         "--input",
         type=Path,
-        required=True,
         help="Input JSON file with review data"
     )
+    inputs.add_argument(
+        "--input-glob",
+        help="Glob of input JSON files to review in parallel (** matches "
+             "nested directories); each report is written next to its input "
+             "as <name>.md"
+    )
     parser.add_argument(
         "--output",
         type=Path,
-        default=Path("CODE_REVIEW_SUMMARY.md"),
-        help="Output markdown file"
+        help="Output markdown file (default: CODE_REVIEW_SUMMARY.md; "
+             "not allowed with --input-glob)"
     )
     parser.add_argument(
         "--config",
@@ -410,42 +748,38 @@ def main():
         action="store_true",
         help="Use strict mode (fail on warnings)"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Reuse reports for identical input, script and config from this "
+             "directory (caching is off unless given)"
+    )
     
     args = parser.parse_args()
+    config_path = args.config if args.config.exists() else None
     
-    # Load review data
-    try:
-        with open(args.input, 'r') as f:
-            review_data = json.load(f)
-    except Exception as e:
-        print(f"Error loading review data: {e}")
-        return 1
-    
-    # Parse and analyze
-    review_parser = ReviewParser(args.config if args.config.exists() else None)
-    result = review_parser.parse_review_data(review_data)
-    
-    # Generate report
-    report = review_parser.generate_markdown_report(result)
-    
-    # Write output
-    try:
-        with open(args.output, 'w') as f:
-            f.write(report)
-        print(f"Review report generated: {args.output}")
-    except Exception as e:
-        print(f"Error writing report: {e}")
-        return 1
+    if args.input_glob:
+        if args.output is not None:
+            parser.error("--output cannot be used with --input-glob; "
+                         "each report is written next to its input")
+        try:
+            input_paths, output_paths, warnings = _batch_paths(args.input_glob)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        for warning in warnings:
+            print(warning, file=sys.stderr)
+        return _review_batch(
+            input_paths, output_paths, config_path, cache_dir=args.cache_dir
+        )
     
-    # Exit with appropriate code
-    if not result.passed:
-        print(f"❌ Review FAILED (Score: {result.score:.1f}/100)")
-        return 1
-    else:
-        print(f"✅ Review PASSED (Score: {result.score:.1f}/100)")
-        return 0
+    output_path = args.output or Path("CODE_REVIEW_SUMMARY.md")
+    exit_code, messages, warnings = _review_file(
+        args.input, output_path, config_path, cache_dir=args.cache_dir
+    )
+    _print_outcome(messages, warnings)
+    return exit_code
 
 
 if __name__ == "__main__":
     exit(main())
-